@@ -5,7 +5,7 @@ AI/Gemini integration module for text extraction from images.
 import streamlit as st
 import google.generativeai as genai
 from PIL import Image
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 from .config import app_config
 
 def configure_genai(api_key: str) -> None:
@@ -36,14 +36,29 @@ def get_gemini_model(model_name: str = None):
         st.error(f"Error: Could not load model '{model_name}'. Details: {e}")
         return None
 
-def generate_gemini_content(model, prompt: str, image: Image.Image) -> Optional[str]:
+def make_image_part(image_bytes: bytes, mime_type: str) -> Dict[str, Any]:
+    """
+    Wrap already-encoded image bytes as an inline Gemini content part.
+    
+    Passing the original upload avoids the SDK re-encoding a PIL image.
+    
+    Args:
+        image_bytes: Encoded image content (JPEG/PNG)
+        mime_type: MIME type of the image
+        
+    Returns:
+        dict: Inline blob part accepted by generate_content
+    """
+    return {"mime_type": mime_type, "data": image_bytes}
+
+def generate_gemini_content(model, prompt: str, image: Union[Image.Image, Dict[str, Any]]) -> Optional[str]:
     """
     Generate content using Gemini model.
     
     Args:
         model: Gemini model instance
         prompt: Text prompt for the model
-        image: PIL Image object
+        image: PIL Image object or inline image part
         
     Returns:
         Generated text or None if failed
@@ -82,6 +97,9 @@ def get_bible_verse_extraction_prompt() -> str:
     Return only the JSON object, no additional text.
     """
 
+# The prompt never changes, so build it once
+_BIBLE_VERSE_PROMPT = get_bible_verse_extraction_prompt()
+
 class GeminiProcessor:
     """Class to handle Gemini AI processing operations."""
     
@@ -101,12 +119,12 @@ class GeminiProcessor:
         configure_genai(self.api_key)
         self.model = get_gemini_model()
     
-    def extract_bible_verse(self, image: Image.Image) -> Optional[str]:
+    def extract_bible_verse(self, image: Union[Image.Image, Dict[str, Any]]) -> Optional[str]:
         """
         Extract Bible verse information from image.
         
         Args:
-            image: PIL Image object
+            image: PIL Image object or inline image part from make_image_part
             
         Returns:
             Extracted text or None if failed
@@ -115,9 +133,21 @@ class GeminiProcessor:
             st.error("Gemini model not available")
             return None
         
-        prompt = get_bible_verse_extraction_prompt()
-        return generate_gemini_content(self.model, prompt, image)
+        return generate_gemini_content(self.model, _BIBLE_VERSE_PROMPT, image)
     
     def is_ready(self) -> bool:
         """Check if the processor is ready to use."""
         return self.model is not None
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def get_gemini_processor(api_key: str) -> GeminiProcessor:
+    """
+    Get a Gemini processor shared across reruns for the given API key.
+    
+    Args:
+        api_key: Google Gemini API key
+        
+    Returns:
+        GeminiProcessor: Cached processor instance
+    """
+    return GeminiProcessor(api_key)
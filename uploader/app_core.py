@@ -3,29 +3,32 @@ Core application logic and workflow orchestration.
 """
 
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dotenv import load_dotenv
 from typing import Optional, Dict, Any
 
 from .config import get_env_config
-from .image_processor import save_uploaded_file, validate_image_path
+from .image_processor import PASSTHROUGH_IMAGE_TYPES, save_uploaded_file, validate_image_path
 from .validators import validate_api_key
-from .ai_processor import GeminiProcessor
+from .ai_processor import get_gemini_processor, make_image_part
 from .data_formatter import parse_and_format_gemini_output
-from .pinterest_api import PinterestUploader
+from .pinterest_api import get_pinterest_uploader
 from .ui_components import (
-    setup_page_config, render_header, render_sidebar_config,
-    render_file_upload, render_image_preview, render_process_button,
+    setup_page_config, render_header, render_sidebar_config, get_sidebar_config,
+    render_file_upload, persist_upload, discard_persisted_upload, load_uploaded_image,
+    render_image_preview, render_process_button,
     render_results_tabs, render_upload_button, show_success_message,
     show_upload_progress, initialize_session_state, reset_session_state,
 )
 
+# Shared pool for blocking I/O that can overlap with the Gemini call
+_executor = ThreadPoolExecutor(max_workers=4)
+
 class AppWorkflow:
     """Main application workflow orchestrator."""
     
     def __init__(self):
         """Initialize the application workflow."""
-        load_dotenv()
         initialize_session_state()
         setup_page_config()
         
@@ -46,29 +49,33 @@ class AppWorkflow:
         Returns:
             bool: True if processors are ready
         """
-        # Set up Gemini processor
+        # Set up Gemini processor (a non-empty key is all validate_api_key checks)
         api_key = config["api_key"] or self.env_config["gemini_api_key"]
-        if api_key and validate_api_key(api_key):
-            self.gemini_processor = GeminiProcessor(api_key)
-            if not self.gemini_processor.is_ready():
-                return False
-        else:
+        if not api_key:
+            return False
+        self.gemini_processor = get_gemini_processor(api_key)
+        if not self.gemini_processor.is_ready():
+            # Don't keep a processor whose model failed to load
+            get_gemini_processor.clear(api_key)
+            self.gemini_processor = None
             return False
         
         # Set up Pinterest uploader
         pinterest_token = config["pinterest_token"] or self.env_config["pinterest_access_token"]
         board_id = config["board_id"] or self.env_config["pinterest_board_id"]
-        self.pinterest_uploader = PinterestUploader(pinterest_token, board_id)
+        self.pinterest_uploader = get_pinterest_uploader(pinterest_token, board_id)
         
         return True
     
-    def process_image_workflow(self, uploaded_file, config: Dict[str, str]) -> bool:
+    def process_image_workflow(self, uploaded_file, image, config: Dict[str, str], source_path: Path) -> bool:
         """
         Main image processing workflow.
         
         Args:
             uploaded_file: Streamlit uploaded file
+            image: PIL Image already opened from the uploaded file
             config: Configuration from UI
+            source_path: Copy of the upload written by persist_upload
             
         Returns:
             bool: True if processing was successful
@@ -78,14 +85,8 @@ class AppWorkflow:
             st.error("⚠️ Failed to initialize processors. Check your API credentials.")
             return False
         
-        # Save uploaded file
-        try:
-            image_path = save_uploaded_file(uploaded_file)
-            if not validate_image_path(image_path):
-                return False
-        except Exception as e:
-            st.error(f"Error saving uploaded file: {e}")
-            return False
+        # Save uploaded file in the background while Gemini runs
+        save_future = _executor.submit(save_uploaded_file, uploaded_file, source_path=source_path)
         
         # Create progress tracking
         progress_bar = st.progress(0)
@@ -96,13 +97,13 @@ class AppWorkflow:
             status_text.text("🔄 Loading image...")
             progress_bar.progress(20)
             
-            from PIL import Image
-            image = Image.open(uploaded_file)
-            
             # Step 2: Process with AI
             status_text.text("🤖 Extracting text with AI...")
             progress_bar.progress(40)
             
+            # Send JPEG/PNG uploads as-is rather than re-encoding the decoded image
+            if uploaded_file.type in PASSTHROUGH_IMAGE_TYPES:
+                image = make_image_part(uploaded_file.getvalue(), uploaded_file.type)
             raw_output = self.gemini_processor.extract_bible_verse(image)
             if not raw_output:
                 st.error("Failed to extract text from image")
@@ -117,6 +118,11 @@ class AppWorkflow:
                 st.error("Failed to format extracted data")
                 return False
             
+            # Wait for the background save to finish
+            image_path = save_future.result()
+            if not validate_image_path(image_path):
+                return False
+            
             # Step 4: Save to session state
             status_text.text("✅ Processing complete!")
             progress_bar.progress(100)
@@ -124,6 +130,9 @@ class AppWorkflow:
             st.session_state.processed_data = formatted_data
             st.session_state.processing_complete = True
             st.session_state.current_image_path = str(image_path)
+            # Only JPEG/PNG are saved as-is; converted uploads are read back from image_path
+            passthrough = uploaded_file.type in PASSTHROUGH_IMAGE_TYPES
+            st.session_state.image_bytes = uploaded_file.getvalue() if passthrough else None
             
             # Clear progress indicators
             progress_bar.empty()
@@ -152,24 +161,27 @@ class AppWorkflow:
             st.error("No processed data available for upload")
             return False
         
-        # Update Pinterest uploader credentials
+        # Get the cached uploader for the current credentials; cached instances
+        # are shared across sessions, so they are never mutated
         pinterest_token = config["pinterest_token"] or self.env_config["pinterest_access_token"]
         board_id = config["board_id"] or self.env_config["pinterest_board_id"]
-        
-        if self.pinterest_uploader:
-            self.pinterest_uploader.update_credentials(pinterest_token, board_id)
-        else:
-            self.pinterest_uploader = PinterestUploader(pinterest_token, board_id)
+        self.pinterest_uploader = get_pinterest_uploader(pinterest_token, board_id)
         
         # Get image path
         image_path = st.session_state.get('current_image_path', 'uploaded_image.jpg')
         
         # Upload to Pinterest
-        with show_upload_progress():
+        with show_upload_progress() as status:
             success = self.pinterest_uploader.upload_pin(
                 image_path, 
-                st.session_state.processed_data
+                st.session_state.processed_data,
+                image_bytes=st.session_state.get('image_bytes'),
+                progress=lambda label: status.update(label=label)
             )
+            if success:
+                status.update(label="✅ Uploaded to Pinterest", state="complete")
+            else:
+                status.update(label="❌ Upload failed", state="error")
         
         if success:
             show_success_message()
@@ -193,30 +205,48 @@ class AppWorkflow:
             
             if uploaded_file:
                 # Image preview
-                from PIL import Image
-                image = Image.open(uploaded_file)
+                upload_path = persist_upload(uploaded_file)
+                image = load_uploaded_image(uploaded_file.file_id, upload_path)
                 render_image_preview(image, uploaded_file)
                   # Process button
                 if render_process_button():
                     if not validate_api_key(config["api_key"] or self.env_config["gemini_api_key"]):
                         st.error("⚠️ Please enter a valid Gemini API key.")
                     else:
-                        self.process_image_workflow(uploaded_file, config)
+                        self.process_image_workflow(uploaded_file, image, config, upload_path)
+            else:
+                # The uploader was cleared; drop its temp file
+                discard_persisted_upload()
         
         with col2:
             st.markdown("### 📊 Results")
+            self.render_results(uploaded_file is not None)
+    
+    @st.fragment
+    def render_results(self, has_upload: bool):
+        """
+        Render the results column as a fragment.
+        
+        Tab edits and the upload button rerun only this fragment, so they
+        don't reopen the preview image or rebuild the upload column.
+        
+        Args:
+            has_upload: Whether an image is currently uploaded
+        """
+        if not has_upload:
+            st.info("📤 Upload an image to see results here.")
+        elif st.session_state.processing_complete and st.session_state.processed_data:
+            # Credentials may have changed in the sidebar fragment since the last full run
+            config = get_sidebar_config()
             
-            if not uploaded_file:
-                st.info("📤 Upload an image to see results here.")
-            elif st.session_state.processing_complete and st.session_state.processed_data:
-                # Render results tabs
-                upload_initiated = render_results_tabs(st.session_state.processed_data, config)
-                
-                # Handle upload if initiated
-                if upload_initiated:
-                    self.upload_to_pinterest_workflow(config)
-            else:
-                st.info("🔄 Process an image to see results here.")
+            # Render results tabs
+            upload_initiated = render_results_tabs(st.session_state.processed_data, config)
+            
+            # Handle upload if initiated
+            if upload_initiated:
+                self.upload_to_pinterest_workflow(config)
+        else:
+            st.info("🔄 Process an image to see results here.")
 
 def main():
     """Main entry point for the application."""
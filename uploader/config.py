@@ -3,10 +3,15 @@ Configuration module for the Trinity Catholic Media app.
 Contains all constants, settings, and configuration classes.
 """
 
+import functools
 import os
 from dataclasses import dataclass
+from dotenv import load_dotenv
 from typing import List
 
+# Read .env once per process, before any configuration is looked up
+load_dotenv()
+
 # --- Constants ---
 DEFAULT_TITLE = "Trinity Catholic Media"
 DEFAULT_DESCRIPTION = (
@@ -24,12 +29,17 @@ REQUIRED_KEYS = [
     "alternative_text_for_main_content",
     "confidence_level",
 ]
+REQUIRED_KEYS_SET = frozenset(REQUIRED_KEYS)
+# Pinterest pin fields that must be non-blank before uploading
+PIN_REQUIRED_FIELDS = ("title", "description", "alt_text")
 
 @dataclass
 class Config:
     """Application configuration settings."""
     DEFAULT_IMAGE_PATH: str = "tst.jpg"
     GEMINI_MODEL_NAME: str = "gemini-2.5-flash-preview-05-20"
+    UPLOAD_MAX_ATTEMPTS: int = 3
+    UPLOAD_TIMEOUT_SECONDS: float = 60
     DEFAULT_TAGS: List[str] = None
     
     def __post_init__(self):
@@ -52,8 +62,9 @@ class UIConfig:
         if self.SUPPORTED_IMAGE_TYPES is None:
             self.SUPPORTED_IMAGE_TYPES = ["jpg", "jpeg", "png"]
 
+@functools.lru_cache(maxsize=1)
 def get_env_config() -> dict:
-    """Get environment-based configuration."""
+    """Get environment-based configuration (read once per process; do not mutate)."""
     return {
         "gemini_api_key": os.getenv("GEMINI_API_KEY", ""),
         "pinterest_access_token": os.getenv("PINTEREST_ACCESS_TOKEN", ""),
@@ -4,45 +4,25 @@ Data formatting module for processing and formatting extracted data.
 
 import streamlit as st
 import json
-from typing import Dict, Any, Optional
-from .config import DEFAULT_TITLE, DEFAULT_DESCRIPTION, WHATSAPP_LINK, REQUIRED_KEYS
+import operator
+import re
+from typing import Dict, Any
+from .config import DEFAULT_TITLE, DEFAULT_DESCRIPTION, WHATSAPP_LINK, REQUIRED_KEYS, REQUIRED_KEYS_SET
 
-def clean_json_string(json_str: str) -> str:
-    """
-    Clean JSON string by removing markdown formatting.
-    
-    Args:
-        json_str: Raw JSON string
-        
-    Returns:
-        Cleaned JSON string
-    """
-    cleaned = json_str.strip()
-    for marker in ["```json", "```"]:
-        if cleaned.startswith(marker):
-            cleaned = cleaned[len(marker):]
-        if cleaned.endswith(marker):
-            cleaned = cleaned[:-len(marker)]
-    cleaned = cleaned.strip()
-    cleaned = cleaned.replace(",\n}", "\n}").replace(",\n]", "\n]")
-    return cleaned
+# Prefer orjson for parsing; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
-def parse_json_safely(json_str: str, original_str: str) -> Optional[Dict[str, Any]]:
-    """
-    Safely parse JSON string with error handling.
-    
-    Args:
-        json_str: JSON string to parse
-        original_str: Original string for error reporting
-        
-    Returns:
-        Parsed dictionary or None if failed
-    """
-    try:
-        return json.loads(json_str)
-    except json.JSONDecodeError as e:
-        st.error(f"Error parsing JSON: {e}\nRaw output was:\n{original_str}")
-        return None
+# Pulls all required values out of a dict in one call
+_REQUIRED_GETTER = operator.itemgetter(*REQUIRED_KEYS)
+
+# Captures the body of a ```json ... ``` fenced block; either fence may be missing
+_FENCE_RE = re.compile(r'^\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*$', re.DOTALL)
+# Matches a trailing comma before a closing brace/bracket
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
 
 def ensure_required_fields(data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -56,6 +36,8 @@ def ensure_required_fields(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     if not isinstance(data, dict):
         return {}
+    if data.keys() >= REQUIRED_KEYS_SET:
+        return dict(zip(REQUIRED_KEYS, _REQUIRED_GETTER(data)))
     return {key: data.get(key) for key in REQUIRED_KEYS}
 
 def format_title(title: str) -> str:
@@ -98,22 +80,16 @@ def format_alt_text(alt_text: str) -> str:
     """
     return alt_text.strip() if alt_text else ""
 
-def parse_and_format_gemini_output(output_str: str) -> Dict[str, Any]:
+def _format_parsed(parsed_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Parse and format Gemini AI output into Pinterest-ready format.
+    Format already-parsed Gemini data into Pinterest-ready format.
     
     Args:
-        output_str: Raw output from Gemini AI
+        parsed_data: Parsed Gemini AI output
         
     Returns:
         Formatted data dictionary
     """
-    if not output_str:
-        return {}
-        
-    cleaned_str = clean_json_string(output_str)
-    parsed_data = parse_json_safely(cleaned_str, output_str)
-    
     if not parsed_data:
         return {}
     
@@ -133,6 +109,37 @@ def parse_and_format_gemini_output(output_str: str) -> Dict[str, Any]:
         st.error(f"Error formatting output: {e}")
         return {}
 
+def parse_and_format_gemini_output(output_str: str) -> Dict[str, Any]:
+    """
+    Parse and format Gemini AI output into Pinterest-ready format.
+    
+    Args:
+        output_str: Raw output from Gemini AI
+        
+    Returns:
+        Formatted data dictionary
+    """
+    if not output_str:
+        return {}
+    
+    # Fast path: the model returned bare JSON
+    try:
+        parsed_data = _loads(output_str)
+    except json.JSONDecodeError:
+        # Strip markdown code fences, then patch trailing commas as a last resort
+        body = _FENCE_RE.match(output_str).group(1)
+        try:
+            parsed_data = _loads(body)
+        except json.JSONDecodeError:
+            try:
+                parsed_data = _loads(_TRAILING_COMMA_RE.sub(r'\1', body))
+            except json.JSONDecodeError as e:
+                st.error(f"Error parsing JSON: {e}\nRaw output was:\n{output_str}")
+                return {}
+    
+    return _format_parsed(parsed_data)
+
+@st.cache_data(max_entries=64, show_spinner=False)
 def extract_verse_parts(description: str) -> Dict[str, str]:
     """
     Extract Malayalam and English parts from formatted description.
@@ -143,22 +150,19 @@ def extract_verse_parts(description: str) -> Dict[str, str]:
     Returns:
         Dictionary with malayalam_text and english_text
     """
-    result = {
-        "malayalam_text": "Not extracted",
-        "english_text": "Not available"
-    }
-    
-    if not description:
-        return result
-    
-    # Extract Malayalam part (before "English:")
-    if 'English:' in description:
-        result["malayalam_text"] = description.split('\n\nEnglish:')[0]
-        # Extract English part (after "English:" but before WhatsApp link)
-        english_part = description.split('English: ')[1].split('\n\n')[0]
-        result["english_text"] = english_part
+    # Malayalam part is before "English:", English part runs up to the WhatsApp link
+    malayalam_text, separator, rest = (description or "").partition('\n\nEnglish: ')
+    if not separator:
+        return {
+            "malayalam_text": "Not extracted",
+            "english_text": "Not available"
+        }
     
-    return result
+    english_text, _, _ = rest.partition('\n\n')
+    return {
+        "malayalam_text": malayalam_text,
+        "english_text": english_text
+    }
 
 class DataFormatter:
     """Class to handle data formatting operations."""
@@ -174,7 +178,9 @@ class DataFormatter:
         Returns:
             Formatted data for Pinterest
         """
-        return parse_and_format_gemini_output(json.dumps(raw_data) if isinstance(raw_data, dict) else str(raw_data))
+        if isinstance(raw_data, dict):
+            return _format_parsed(raw_data)
+        return parse_and_format_gemini_output(str(raw_data))
     
     @staticmethod
     def validate_and_clean_data(data: Dict[str, Any]) -> Dict[str, Any]:
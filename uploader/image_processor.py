@@ -3,11 +3,19 @@ Image processing module for handling image operations.
 Includes validation, loading, and basic image utilities.
 """
 
+import io
+import shutil
 import streamlit as st
 from pathlib import Path
 from PIL import Image
 from typing import Optional
 
+# Upload types Pinterest accepts as-is, mapped to the file suffix to save them with
+PASSTHROUGH_IMAGE_TYPES = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+}
+
 def validate_image_path(image_path: Path) -> bool:
     """
     Validate if the image path exists.
@@ -39,22 +47,57 @@ def load_image(image_path: Path) -> Optional[Image.Image]:
         st.error(f"Error opening image: {e}")
         return None
 
-def save_uploaded_file(uploaded_file, filename: str = "uploaded_image.jpg") -> Path:
+def save_uploaded_file(uploaded_file, filename: str = "uploaded_image.jpg",
+                       source_path: Optional[Path] = None) -> Path:
     """
     Save uploaded Streamlit file to disk.
     
+    JPEG and PNG uploads are written byte-for-byte without decoding; any
+    other format is converted to JPEG.
+    
     Args:
         uploaded_file: Streamlit uploaded file object
         filename: Name to save the file as
+        source_path: Optional copy of the upload already on disk; read from
+            it instead of the in-memory upload
         
     Returns:
         Path: Path to the saved file
     """
-    image = Image.open(uploaded_file)
-    image_path = Path(filename)
-    image.save(image_path)
+    suffix = PASSTHROUGH_IMAGE_TYPES.get(uploaded_file.type)
+    if suffix:
+        image_path = Path(filename).with_suffix(suffix)
+        if source_path is not None:
+            shutil.copyfile(source_path, image_path)
+        else:
+            image_path.write_bytes(uploaded_file.getbuffer())
+        return image_path
+    
+    image_path = Path(filename).with_suffix(".jpg")
+    # Decode from a separate buffer so the upload's read position is untouched
+    source = source_path if source_path is not None else io.BytesIO(uploaded_file.getbuffer())
+    with Image.open(source) as img:
+        img.convert("RGB").save(image_path, "JPEG")
     return image_path
 
+def create_preview_image(uploaded_file, max_width: int) -> Image.Image:
+    """
+    Create a downscaled preview of an uploaded image.
+    
+    The preview is decoded from its own lazily-opened copy so JPEG draft
+    mode can shrink it during decode, leaving the full-size image untouched.
+    
+    Args:
+        uploaded_file: Streamlit uploaded file object
+        max_width: Maximum preview width in pixels
+        
+    Returns:
+        PIL Image object no wider than max_width
+    """
+    preview = Image.open(io.BytesIO(uploaded_file.getbuffer()))
+    preview.thumbnail((max_width, preview.height), Image.Resampling.LANCZOS, reducing_gap=2.0)
+    return preview
+
 def get_image_info(image: Image.Image) -> dict:
     """
     Extract basic information about an image.
@@ -73,23 +116,17 @@ def get_image_info(image: Image.Image) -> dict:
         "mode": image.mode
     }
 
-def calculate_file_size(uploaded_file) -> dict:
+def calculate_file_size(uploaded_file) -> str:
     """
-    Calculate file size information.
+    Format the size of an uploaded file for display.
     
     Args:
         uploaded_file: Streamlit uploaded file object
         
     Returns:
-        dict: File size information
+        str: Human-readable file size (KB or MB)
     """
-    file_size_bytes = len(uploaded_file.getvalue())
-    file_size_kb = file_size_bytes / 1024
-    file_size_mb = file_size_kb / 1024
-    
-    return {
-        "bytes": file_size_bytes,
-        "kb": file_size_kb,
-        "mb": file_size_mb,
-        "formatted": f"{file_size_mb:.1f} MB" if file_size_mb > 1 else f"{file_size_kb:.1f} KB"
-    }
+    size_bytes = uploaded_file.size
+    if size_bytes > 1048576:
+        return f"{size_bytes / 1048576:.1f} MB"
+    return f"{size_bytes / 1024:.1f} KB"
@@ -4,13 +4,104 @@ Pinterest API integration module for uploading pins.
 
 import streamlit as st
 import requests
-import json
 import base64
+import mimetypes
 import os
-from typing import Dict, Any, Optional
-from .config import get_env_config
+import time
+from urllib3.exceptions import NewConnectionError
+from typing import Callable, Dict, Any, Optional
+from .config import PIN_REQUIRED_FIELDS, app_config, get_env_config
 
-def upload_to_pinterest(image_path: str, formatted_data: Dict[str, Any], access_token: str, board_id: str) -> bool:
+# Read size for base64 encoding; a multiple of 3 so chunks encode without padding
+BASE64_CHUNK_SIZE = 48 * 1024
+
+def create_pinterest_session(access_token: str) -> requests.Session:
+    """
+    Create an HTTP session authenticated against the Pinterest API.
+    
+    Args:
+        access_token: Pinterest access token
+        
+    Returns:
+        requests.Session: Session with auth headers set, reusing connections across calls
+    """
+    session = requests.Session()
+    session.headers.update({
+        'Authorization': f'Bearer {access_token}',
+        'Content-Type': 'application/json',
+    })
+    return session
+
+# Statuses Pinterest returns without having created anything, so a retry is safe
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+def _failed_before_sending(error: requests.exceptions.ConnectionError) -> bool:
+    """
+    Check if a connection error happened before the request was sent.
+    
+    Args:
+        error: Connection error raised by requests
+        
+    Returns:
+        bool: True if the connection was never established
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+def post_with_retry(session, url: str, max_attempts: int = None, **kwargs) -> requests.Response:
+    """
+    POST to the Pinterest API, retrying only failures that can't have created anything.
+    
+    Pin creation isn't idempotent, so only connection failures before the
+    request was sent and explicit 429/503 responses are retried; other errors
+    (including 502/504 and dropped connections) are returned or raised as-is.
+    
+    Args:
+        session: requests.Session used to send the request
+        url: Endpoint URL
+        max_attempts: Maximum number of attempts
+        **kwargs: Extra arguments passed to session.post
+        
+    Returns:
+        requests.Response: The last response received
+    """
+    if max_attempts is None:
+        max_attempts = app_config.UPLOAD_MAX_ATTEMPTS
+    kwargs.setdefault("timeout", app_config.UPLOAD_TIMEOUT_SECONDS)
+    
+    for attempt in range(max_attempts):
+        last_attempt = attempt == max_attempts - 1
+        try:
+            response = session.post(url, **kwargs)
+        except requests.exceptions.ConnectionError as e:
+            if last_attempt or not _failed_before_sending(e):
+                raise
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES or last_attempt:
+                return response
+        time.sleep(2 ** attempt)
+
+def _encode_file_base64(image_path: str) -> str:
+    """
+    Base64-encode a file chunk by chunk so the raw file is never fully in memory.
+    
+    Args:
+        image_path: Path to the image file
+        
+    Returns:
+        str: Base64-encoded file content
+    """
+    encoded = bytearray()
+    with open(image_path, "rb") as img_file:
+        while chunk := img_file.read(BASE64_CHUNK_SIZE):
+            encoded += base64.b64encode(chunk)
+    return encoded.decode("ascii")
+
+def upload_to_pinterest(image_path: str, formatted_data: Dict[str, Any], access_token: str, board_id: str,
+                        session: Optional[requests.Session] = None, image_bytes: Optional[bytes] = None,
+                        progress: Optional[Callable[[str], None]] = None) -> bool:
     """
     Upload an image as a pin to Pinterest.
     
@@ -19,12 +110,14 @@ def upload_to_pinterest(image_path: str, formatted_data: Dict[str, Any], access_
         formatted_data: Formatted data for Pinterest
         access_token: Pinterest access token
         board_id: Pinterest board ID
+        session: Optional authenticated session to reuse connections
+        image_bytes: Optional in-memory image content; skips reading image_path
+        progress: Optional callback receiving a label as each upload stage starts
         
     Returns:
         bool: True if successful, False otherwise
     """
-    required_fields = ["title", "description", "alt_text"]
-    if not all(formatted_data.get(field) for field in required_fields):
+    if not all(map(formatted_data.get, PIN_REQUIRED_FIELDS)):
         st.error("Missing required fields for Pinterest upload")
         return False
     
@@ -32,25 +125,27 @@ def upload_to_pinterest(image_path: str, formatted_data: Dict[str, Any], access_
     env_config = get_env_config()
     link = env_config["whatsapp_link"]
     
-    # Convert image to base64
+    if progress:
+        progress("🖼️ Encoding image...")
+    
+    # Convert image to base64, reading the file chunk by chunk when it isn't already in memory
     try:
-        with open(image_path, "rb") as img_file:
-            image_base64 = base64.b64encode(img_file.read()).decode("utf-8")
+        if image_bytes is not None:
+            image_base64 = base64.b64encode(image_bytes).decode("ascii")
+        else:
+            image_base64 = _encode_file_base64(image_path)
     except Exception as e:
         st.error(f"Error reading image for base64 upload: {e}")
         return False
     
-    # Prepare headers and payload
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json',
-    }
+    if session is None:
+        session = create_pinterest_session(access_token)
     
     payload = {
         'board_id': board_id,
         'media_source': {
             'source_type': 'image_base64',
-            'content_type': 'image/jpeg',
+            'content_type': mimetypes.guess_type(str(image_path))[0] or 'image/jpeg',
             'data': image_base64,
         },
         'title': formatted_data["title"],
@@ -60,11 +155,13 @@ def upload_to_pinterest(image_path: str, formatted_data: Dict[str, Any], access_
     }
     
     # Make API request
+    if progress:
+        progress("📌 Creating pin...")
     try:
-        response = requests.post(
+        response = post_with_retry(
+            session,
             'https://api.pinterest.com/v5/pins',
-            headers=headers,
-            data=json.dumps(payload)
+            json=payload
         )
         
         if response.ok:
@@ -93,18 +190,22 @@ class PinterestUploader:
         env_config = get_env_config()
         self.access_token = access_token or env_config["pinterest_access_token"]
         self.board_id = board_id or env_config["pinterest_board_id"]
+        self.session = create_pinterest_session(self.access_token)
     
     def is_configured(self) -> bool:
         """Check if Pinterest credentials are configured."""
         return bool(self.access_token and self.board_id)
     
-    def upload_pin(self, image_path: str, data: Dict[str, Any]) -> bool:
+    def upload_pin(self, image_path: str, data: Dict[str, Any], image_bytes: Optional[bytes] = None,
+                   progress: Optional[Callable[[str], None]] = None) -> bool:
         """
         Upload a pin to Pinterest.
         
         Args:
             image_path: Path to the image file
             data: Pin data (title, description, alt_text)
+            image_bytes: Optional in-memory image content; skips reading image_path
+            progress: Optional callback receiving a label as each upload stage starts
             
         Returns:
             bool: True if successful
@@ -113,7 +214,10 @@ class PinterestUploader:
             st.error("Pinterest credentials not configured")
             return False
         
-        return upload_to_pinterest(image_path, data, self.access_token, self.board_id)
+        return upload_to_pinterest(
+            image_path, data, self.access_token, self.board_id,
+            session=self.session, image_bytes=image_bytes, progress=progress
+        )
     
     def validate_pin_data(self, data: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -138,14 +242,17 @@ class PinterestUploader:
                 errors[field] = error_msg
         
         return errors
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def get_pinterest_uploader(access_token: str, board_id: str) -> PinterestUploader:
+    """
+    Get a Pinterest uploader shared across reruns for the given credentials.
     
-    def update_credentials(self, access_token: str, board_id: str):
-        """
-        Update Pinterest credentials.
+    Args:
+        access_token: Pinterest access token
+        board_id: Pinterest board ID
         
-        Args:
-            access_token: New access token
-            board_id: New board ID
-        """
-        self.access_token = access_token
-        self.board_id = board_id
+    Returns:
+        PinterestUploader: Cached uploader instance with its HTTP session
+    """
+    return PinterestUploader(access_token, board_id)
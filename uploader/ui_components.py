@@ -2,14 +2,54 @@
 UI components module for Streamlit interface elements.
 """
 
+import contextlib
+import shutil
+import tempfile
 import streamlit as st
-from typing import Dict, Any, Optional, Tuple
-from PIL import Image
-from .config import ui_config
-from .image_processor import get_image_info, calculate_file_size
-from .data_formatter import extract_verse_parts
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
+from .config import PIN_REQUIRED_FIELDS, ui_config
 from .validators import validate_pinterest_data, validate_confidence_level
 
+# Pillow and the image/text helpers are imported where first needed
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Static markup, built once at import
+_HEADER_HTML = """
+<div class="main-header">
+    <h1>📖 Trinity Catholic Media</h1>
+    <h3>Bible Verse Image to Pinterest Pin Converter</h3>
+    <p>Transform Malayalam Bible verse images into beautiful Pinterest pins</p>
+</div>
+"""
+# Sidebar config names mapped to the session state keys of their widgets
+_SIDEBAR_CONFIG_KEYS = {
+    "api_key": "gemini_api_key",
+    "pinterest_token": "pinterest_access_token",
+    "board_id": "pinterest_board_id",
+}
+# Summary validation row label for each of PIN_REQUIRED_FIELDS
+_VALIDATION_LABELS = {
+    "title": "📋 Title",
+    "description": "📄 Description",
+    "alt_text": "🔍 Alt Text",
+}
+# Validation result -> (icon, status text)
+_VALIDATION_DISPLAY = {True: ("✅", "Valid"), False: ("❌", "Missing/Empty")}
+# Confidence level -> (alert function, message); unknown levels use "low"
+_CONF_DISPATCH = {
+    "high": (st.success, "🎯 High Confidence - Ready to upload!"),
+    "medium": (st.warning, "⚠️ Medium Confidence - Please review before uploading"),
+    "low": (st.error, "❗ Low Confidence - Consider using a different image"),
+}
+_RESULT_TABS = ("📝 Content", "🎯 Pinterest Data", "📋 Summary")
+_SUMMARY_TIP = "💡 **Tip:** You can edit the Pinterest data in the '🎯 Pinterest Data' tab before uploading."
+
+# Per-process home for persisted uploads; removed with everything in it
+# when the server exits, so files from abandoned sessions don't pile up
+_UPLOAD_DIR = tempfile.TemporaryDirectory(prefix="tcm-uploads-")
+
 def setup_page_config():
     """Set up Streamlit page configuration."""
     st.set_page_config(
@@ -21,13 +61,7 @@ def setup_page_config():
 
 def render_header():
     """Render the main header section."""
-    st.markdown("""
-    <div class="main-header">
-        <h1>📖 Trinity Catholic Media</h1>
-        <h3>Bible Verse Image to Pinterest Pin Converter</h3>
-        <p>Transform Malayalam Bible verse images into beautiful Pinterest pins</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(_HEADER_HTML)
 
 def render_sidebar_config() -> Dict[str, str]:
     """
@@ -39,32 +73,49 @@ def render_sidebar_config() -> Dict[str, str]:
     with st.sidebar:
         st.markdown("### 🔑 Configuration")
         st.markdown("#### 🔐 API Credentials")
-        
-        api_key = st.text_input(
+        render_credential_inputs()
+    
+    return get_sidebar_config()
+
+@st.fragment
+def render_credential_inputs() -> None:
+    """
+    Render the credential inputs as a form inside a fragment.
+    
+    Values are only committed to session state when the form is saved, and
+    saving reruns only this fragment; read them with get_sidebar_config.
+    """
+    with st.form("sidebar_creds", clear_on_submit=False):
+        st.text_input(
             "Gemini API Key", 
-            value=st.session_state.get("gemini_api_key", ""), 
+            key="gemini_api_key", 
             type="password",
             help="Your Google Gemini API key for text extraction"
         )
         
-        pinterest_token = st.text_input(
+        st.text_input(
             "Pinterest Access Token", 
-            value=st.session_state.get("pinterest_access_token", ""), 
+            key="pinterest_access_token", 
             type="password",
             help="Your Pinterest API access token"
         )
         
-        board_id = st.text_input(
+        st.text_input(
             "Pinterest Board ID", 
-            value=st.session_state.get("pinterest_board_id", ""),
+            key="pinterest_board_id",
             help="The ID of the Pinterest board to post to"
         )
+        
+        st.form_submit_button("💾 Save Credentials", use_container_width=True)
+
+def get_sidebar_config() -> Dict[str, str]:
+    """
+    Get the current sidebar configuration from session state.
     
-    return {
-        "api_key": api_key,
-        "pinterest_token": pinterest_token,
-        "board_id": board_id
-    }
+    Returns:
+        dict: Configuration values from sidebar
+    """
+    return {name: st.session_state[key] for name, key in _SIDEBAR_CONFIG_KEYS.items()}
 
 def render_file_upload() -> Optional[Any]:
     """
@@ -80,7 +131,98 @@ def render_file_upload() -> Optional[Any]:
         help="Upload an image containing Malayalam Bible verse text"
     )
 
-def render_image_preview(image: Image.Image, uploaded_file: Any) -> None:
+def persist_upload(uploaded_file: Any) -> Path:
+    """
+    Write an uploaded file to a temp file once per upload.
+    
+    Only the session's current upload is kept: the previous temp file is
+    removed when a different file arrives or the uploader is cleared.
+    
+    Args:
+        uploaded_file: Streamlit uploaded file object
+        
+    Returns:
+        Path: Path to the persisted copy
+    """
+    persisted = st.session_state.persisted_upload
+    if persisted is not None:
+        file_id, path = persisted
+        if file_id == uploaded_file.file_id and path.exists():
+            return path
+        discard_persisted_upload()
+    
+    suffix = Path(uploaded_file.name).suffix.lower()
+    path = Path(_UPLOAD_DIR.name) / f"{uploaded_file.file_id}{suffix}"
+    uploaded_file.seek(0)
+    with path.open("wb") as fh:
+        shutil.copyfileobj(uploaded_file, fh, length=1 << 20)
+    uploaded_file.seek(0)
+    st.session_state.persisted_upload = (uploaded_file.file_id, path)
+    return path
+
+def discard_persisted_upload() -> None:
+    """Delete the temp file written by persist_upload, if any."""
+    persisted = st.session_state.get('persisted_upload')
+    if persisted is None:
+        return
+    file_id, path = persisted
+    load_uploaded_image.clear(file_id, path)
+    _cached_preview_image.clear(file_id)
+    _cached_image_info.clear(file_id)
+    # The file may still be open elsewhere (e.g. on Windows); leave it then
+    with contextlib.suppress(OSError):
+        path.unlink(missing_ok=True)
+    st.session_state.persisted_upload = None
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def load_uploaded_image(file_id: str, path: Path) -> "Image.Image":
+    """
+    Open an uploaded image once per file and reuse it across reruns.
+    
+    Pixels are decoded lazily from disk on first use and stay on the
+    cached object.
+    
+    Args:
+        file_id: Streamlit upload ID used as the cache key
+        path: Path returned by persist_upload
+        
+    Returns:
+        PIL Image object
+    """
+    from PIL import Image
+    return Image.open(path)
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _cached_preview_image(file_id: str, _uploaded_file: Any) -> "Image.Image":
+    """
+    Build the downscaled preview once per uploaded file.
+    
+    Args:
+        file_id: Streamlit upload ID used as the cache key
+        _uploaded_file: Streamlit uploaded file object (excluded from hashing)
+        
+    Returns:
+        PIL Image object sized for the preview
+    """
+    from .image_processor import create_preview_image
+    return create_preview_image(_uploaded_file, ui_config.MAX_IMAGE_WIDTH_PREVIEW)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_image_info(file_id: str, _image: "Image.Image") -> dict:
+    """
+    Get image info once per uploaded file.
+    
+    Args:
+        file_id: Streamlit upload ID used as the cache key
+        _image: PIL Image object (excluded from hashing)
+        
+    Returns:
+        dict: Image information from get_image_info
+    """
+    from .image_processor import get_image_info
+    return get_image_info(_image)
+
+def render_image_preview(image: "Image.Image", uploaded_file: Any) -> None:
     """
     Render image preview with details.
     
@@ -88,23 +230,25 @@ def render_image_preview(image: Image.Image, uploaded_file: Any) -> None:
         image: PIL Image object
         uploaded_file: Streamlit uploaded file object
     """
+    from .image_processor import calculate_file_size
+    
     preview_col, info_col = st.columns([1, 1])
     
     with preview_col:
         st.markdown("### 🖼️ Preview")
-        st.image(image, caption="Uploaded Image", width=ui_config.MAX_IMAGE_WIDTH_PREVIEW)
+        preview = _cached_preview_image(uploaded_file.file_id, uploaded_file)
+        st.image(preview, caption="Uploaded Image", width=ui_config.MAX_IMAGE_WIDTH_PREVIEW)
     
     with info_col:
         st.markdown("### ℹ️ Details")
         
         # Image info
-        img_info = get_image_info(image)
+        img_info = _cached_image_info(uploaded_file.file_id, image)
         st.write(f"**Format:** {img_info['format']}")
         st.write(f"**Size:** {img_info['width']} x {img_info['height']}")
         
         # File size info
-        size_info = calculate_file_size(uploaded_file)
-        st.write(f"**File Size:** {size_info['formatted']}")
+        st.write(f"**File Size:** {calculate_file_size(uploaded_file)}")
 
 def render_process_button() -> bool:
     """
@@ -125,6 +269,8 @@ def render_results_tabs(processed_data: Dict[str, Any], config: Dict[str, str] =
     """
     Render results tabs with processed data.
     
+    Tabs are selected with a radio so only the active tab's body runs.
+    
     Args:
         processed_data: Processed data from AI
         config: Configuration from sidebar
@@ -132,20 +278,22 @@ def render_results_tabs(processed_data: Dict[str, Any], config: Dict[str, str] =
     Returns:
         bool: True if upload was initiated
     """
-    tab1, tab2, tab3 = st.tabs(["📝 Content", "🎯 Pinterest Data", "📋 Summary"])
-    
-    upload_initiated = False
+    tab = st.radio(
+        "View",
+        _RESULT_TABS,
+        horizontal=True,
+        key="active_tab",
+        label_visibility="collapsed"
+    )
     
-    with tab1:
+    if tab == "📝 Content":
         render_content_tab(processed_data)
-    
-    with tab2:
+    elif tab == "🎯 Pinterest Data":
         render_pinterest_data_tab(processed_data)
+    else:
+        return render_summary_tab(processed_data, config)
     
-    with tab3:
-        upload_initiated = render_summary_tab(processed_data, config)
-    
-    return upload_initiated
+    return False
 
 def render_content_tab(data: Dict[str, Any]) -> None:
     """
@@ -154,6 +302,8 @@ def render_content_tab(data: Dict[str, Any]) -> None:
     Args:
         data: Processed data
     """
+    from .data_formatter import extract_verse_parts
+    
     subcol1, subcol2 = st.columns(2)
     
     # Extract verse parts
@@ -180,7 +330,7 @@ def render_pinterest_data_tab(data: Dict[str, Any]) -> None:
     st.markdown("### ✏️ Edit Pinterest Data")
     st.markdown("*You can modify the data below before uploading to Pinterest*")
     
-    with st.form("pinterest_data_form"):
+    with st.form("pinterest_data_form", clear_on_submit=False):
         st.markdown("#### 📝 Pinterest Pin Details")
         
         # Editable fields
@@ -213,22 +363,24 @@ def render_pinterest_data_tab(data: Dict[str, Any]) -> None:
         
         with col1_form:
             if st.form_submit_button("💾 Save Changes", type="primary", use_container_width=True):
-                # Update session state
-                st.session_state.processed_data.update({
+                # Replace the dict in one assignment; the form submit already
+                # triggered this rerun, so no st.rerun() is needed
+                data = {
+                    **data,
                     'title': edited_title,
                     'description': edited_description,
                     'alt_text': edited_alt_text
-                })
+                }
+                st.session_state.processed_data = data
                 st.session_state.data_edited = True
                 st.success("✅ Changes saved successfully!")
-                st.rerun()
         
         with col2_form:
             if st.form_submit_button("🔄 Reset to Original", type="secondary", use_container_width=True):
                 st.info("💡 To reset, please reprocess the image.")
     
-    # Show raw JSON data
-    with st.expander("🔍 View Raw JSON Data"):
+    # Show raw JSON data; only serialized while the toggle is on
+    if st.toggle("🔍 View Raw JSON Data", key="show_json"):
         st.json(data)
 
 def render_summary_tab(data: Dict[str, Any], config: Dict[str, str] = None) -> bool:
@@ -242,56 +394,52 @@ def render_summary_tab(data: Dict[str, Any], config: Dict[str, str] = None) -> b
     Returns:
         bool: True if upload was initiated
     """
-    confidence = data.get("confidence_level", "low")
+    confidence = data.get("confidence_level", "low").lower()
     
     st.markdown("### 📊 Upload Summary")
     
-    # Data validation
+    # Data validation, computed once and shared with the upload button
     validation_results = validate_pinterest_data(data)
     
-    col1_summary, col2_summary = st.columns([1, 1])
+    # Heading and validation table in a single markdown element
+    rows = ["#### ✅ Data Validation", "", "| Field | Status |", "| --- | --- |"]
+    for field in PIN_REQUIRED_FIELDS:
+        icon, status = _VALIDATION_DISPLAY[validation_results[field]]
+        rows.append(f"| {_VALIDATION_LABELS[field]} | {icon} {status} |")
+    st.markdown("\n".join(rows))
     
-    with col1_summary:
-        st.markdown("#### ✅ Data Validation")
-        st.write(f"📋 Title: {'✅' if validation_results['title'] else '❌'} {'Valid' if validation_results['title'] else 'Missing/Empty'}")
-        st.write(f"📄 Description: {'✅' if validation_results['description'] else '❌'} {'Valid' if validation_results['description'] else 'Missing/Empty'}")
-        st.write(f"🔍 Alt Text: {'✅' if validation_results['alt_text'] else '❌'} {'Valid' if validation_results['alt_text'] else 'Missing/Empty'}")
-    
-    with col2_summary:
-        st.markdown("#### 🎯 AI Analysis")
-        if confidence == "high":
-            st.success("🎯 High Confidence - Ready to upload!")
-        elif confidence == "medium":
-            st.warning("⚠️ Medium Confidence - Please review before uploading")
-        else:
-            st.error("❗ Low Confidence - Consider using a different image")
+    st.markdown("#### 🎯 AI Analysis")
+    alert, message = _CONF_DISPATCH.get(confidence, _CONF_DISPATCH["low"])
+    alert(message)
     
     # Instructions
     st.markdown("---")
-    st.info("💡 **Tip:** You can edit the Pinterest data in the '🎯 Pinterest Data' tab before uploading.")
+    st.info(_SUMMARY_TIP)
     
     # Upload button
     if config:
-        button_clicked, upload_ready = render_upload_button(data, config)
+        button_clicked, upload_ready = render_upload_button(
+            data, config, validation_results, validate_confidence_level(confidence)
+        )
         return button_clicked and upload_ready
     
     return False
 
-def render_upload_button(data: Dict[str, Any], config: Dict[str, str]) -> Tuple[bool, bool]:
+def render_upload_button(data: Dict[str, Any], config: Dict[str, str],
+                         validation_results: Dict[str, bool], confidence_valid: bool) -> Tuple[bool, bool]:
     """
     Render upload button with appropriate state.
     
     Args:
         data: Processed data
         config: Configuration from sidebar
+        validation_results: Field validation results from validate_pinterest_data
+        confidence_valid: Whether the confidence level allows upload
         
     Returns:
         tuple: (button_clicked, upload_ready)
     """
-    confidence = data.get("confidence_level", "low")
-    validation_results = validate_pinterest_data(data)
     all_data_valid = all(validation_results.values())
-    confidence_valid = validate_confidence_level(confidence)
     
     if confidence_valid and all_data_valid:
         button_clicked = st.button(
@@ -322,20 +470,23 @@ def show_success_message():
     st.success("🎉 Successfully posted to Pinterest!")
 
 def show_upload_progress():
-    """Show upload progress spinner."""
-    return st.spinner("📤 Uploading to Pinterest...")
+    """Show upload progress status; update its label as each stage starts."""
+    return st.status("📤 Uploading to Pinterest...", expanded=True)
 
 def initialize_session_state():
     """Initialize Streamlit session state variables."""
-    if 'processed_data' not in st.session_state:
-        st.session_state.processed_data = None
-    if 'processing_complete' not in st.session_state:
-        st.session_state.processing_complete = False
-    if 'data_edited' not in st.session_state:
-        st.session_state.data_edited = False
+    st.session_state.setdefault('processed_data', None)
+    st.session_state.setdefault('processing_complete', False)
+    st.session_state.setdefault('data_edited', False)
+    st.session_state.setdefault('image_bytes', None)
+    st.session_state.setdefault('persisted_upload', None)
+    for key in _SIDEBAR_CONFIG_KEYS.values():
+        st.session_state.setdefault(key, "")
 
 def reset_session_state():
     """Reset session state after successful upload."""
     st.session_state.processed_data = None
     st.session_state.processing_complete = False
-    st.session_state.data_edited = False
\ No newline at end of file
+    st.session_state.data_edited = False
+    st.session_state.image_bytes = None
+    discard_persisted_upload()
\ No newline at end of file
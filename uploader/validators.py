@@ -5,6 +5,10 @@ Validation module for various input validations.
 import streamlit as st
 from pathlib import Path
 from typing import Dict, Any
+from .config import PIN_REQUIRED_FIELDS
+
+# Confidence levels that allow upload
+_OK_CONF = frozenset({"high", "medium"})
 
 def validate_api_key(api_key: str) -> bool:
     """
@@ -50,14 +54,33 @@ def validate_pinterest_data(data: Dict[str, Any]) -> Dict[str, bool]:
     Returns:
         dict: Validation results for each field
     """
-    required_fields = ["title", "description", "alt_text"]
     validation_results = {}
     
-    for field in required_fields:
-        validation_results[field] = bool(data.get(field, '').strip())
+    for field in PIN_REQUIRED_FIELDS:
+        # isspace() avoids allocating a stripped copy just to test for content
+        value = data.get(field) or ""
+        validation_results[field] = bool(value) and not value.isspace()
     
     return validation_results
 
+def any_missing(data: Dict[str, Any]) -> bool:
+    """
+    Check if any required Pinterest field is missing or blank.
+    
+    Stops at the first missing field instead of validating them all.
+    
+    Args:
+        data: Dictionary containing Pinterest data
+        
+    Returns:
+        bool: True if at least one required field is missing
+    """
+    for field in PIN_REQUIRED_FIELDS:
+        value = data.get(field) or ""
+        if not value or value.isspace():
+            return True
+    return False
+
 def validate_all_pinterest_data(data: Dict[str, Any]) -> bool:
     """
     Check if all Pinterest data is valid.
@@ -68,8 +91,7 @@ def validate_all_pinterest_data(data: Dict[str, Any]) -> bool:
     Returns:
         bool: True if all data is valid
     """
-    validation_results = validate_pinterest_data(data)
-    return all(validation_results.values())
+    return not any_missing(data)
 
 def validate_confidence_level(confidence: str) -> bool:
     """
@@ -81,4 +103,4 @@ def validate_confidence_level(confidence: str) -> bool:
     Returns:
         bool: True if acceptable for upload
     """
-    return confidence.lower() in ["high", "medium"]
+    return confidence.lower() in _OK_CONF